@@ -1,5 +1,7 @@
 """Support for Ebeco wifi-enabled thermostats."""
 
+import logging
+
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityFeature,
@@ -8,7 +10,8 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, PRECISION_WHOLE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 
 from .const import (
     DOMAIN,
@@ -21,7 +24,10 @@ from .const import (
 # )
 from .entity import EbecoEntity
 
+_LOGGER = logging.getLogger(__name__)
 
+# Seconds to coalesce bursts of MQTT updates into a single state write
+STATE_WRITE_COOLDOWN = 0.1
 
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
@@ -35,13 +41,75 @@ class EbecoMqttClimate(ClimateEntity):
         self._mqtt_handler = mqtt_handler
         self._data = {"serial": serial}
 
+        # Derived state, recomputed once per MQTT message in data_callback
+        self._hvac_mode = None
+        self._hvac_action = None
+        self._current_temperature = None
+        self._target_temperature = None
+        self._available = None
+
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=STATE_WRITE_COOLDOWN,
+            immediate=True,
+            function=self.async_write_ha_state,
+        )
+
         # Subscribe to data updates
-        async def data_callback(data):
+        @callback
+        def data_callback(data):
             self._data.update(data)
-            self.async_write_ha_state()
+            if self._update_state():
+                self._debouncer.async_schedule_call()
 
         hass.async_create_task(mqtt_handler.async_subscribe(data_callback))
-    
+
+    async def async_will_remove_from_hass(self):
+        """Drop any pending debounced state write."""
+        self._debouncer.async_cancel()
+
+    def _update_state(self):
+        """Recompute the cached state from the merged payload data.
+
+        Returns True if any of the exposed state changed.
+        """
+        hvac_mode = hvac_action = current_temperature = target_temperature = None
+        reg = self._data.get("regulatorStatus")
+        us = self._data.get("userSettings")
+        available = reg is not None and us is not None
+        if available:
+            if us["powerOn"]:
+                hvac_mode = HVACMode.HEAT
+                if reg["regulatorState"]["relayOn"]:
+                    hvac_action = HVACAction.HEATING
+                else:
+                    hvac_action = HVACAction.IDLE
+            else:
+                hvac_mode = HVACMode.OFF
+                hvac_action = HVACAction.OFF
+            current_temperature = reg["sensorReadings"][1]["tUser"]/10 # Todo use real temp
+            target_temperature = us["manualControlTemp"]/10
+
+        new_state = (hvac_mode, hvac_action, current_temperature, target_temperature, available)
+        if new_state == (
+            self._hvac_mode,
+            self._hvac_action,
+            self._current_temperature,
+            self._target_temperature,
+            self._available,
+        ):
+            return False
+
+        (
+            self._hvac_mode,
+            self._hvac_action,
+            self._current_temperature,
+            self._target_temperature,
+            self._available,
+        ) = new_state
+        return True
+
     @property
     def name(self):
         """Return the name of the device, if any."""
@@ -55,7 +123,7 @@ class EbecoMqttClimate(ClimateEntity):
     @property
     def available(self) -> bool:
         """Entity is available once we have seen at least one payload."""
-        return "regulatorStatus" in self._data and "userSettings" in self._data
+        return bool(self._available)
 
     @property
     def supported_features(self):
@@ -72,19 +140,12 @@ class EbecoMqttClimate(ClimateEntity):
     @property
     def hvac_mode(self):
         """Return hvac operation ie. heat, cool mode."""
-        if self._data["userSettings"]["powerOn"]:
-             return HVACMode.HEAT
-        return HVACMode.OFF
+        return self._hvac_mode
 
     @property
     def hvac_action(self):
         """Return hvac action ie. the thermostat relay state."""
-        if self.hvac_mode == HVACMode.HEAT:
-            if self._data["regulatorStatus"]["regulatorState"]["relayOn"]:
-                return HVACAction.HEATING
-            return HVACAction.IDLE
-        else:
-            return HVACAction.OFF
+        return self._hvac_action
     
     @property
     def temperature_unit(self):
@@ -103,12 +164,12 @@ class EbecoMqttClimate(ClimateEntity):
 
     @property
     def current_temperature(self):
-        return self._data["regulatorStatus"]["sensorReadings"][1]["tUser"]/10 # Todo use real temp
+        return self._current_temperature
     
     @property
     def target_temperature(self):
         """Return the temperature we try to reach."""
-        return self._data["userSettings"]["manualControlTemp"]/10
+        return self._target_temperature
 
     @property
     def target_temperature_step(self):
@@ -117,7 +178,6 @@ class EbecoMqttClimate(ClimateEntity):
 
     async def async_set_temperature(self, **kwargs):
         if (temp := kwargs.get(ATTR_TEMPERATURE)) is not None:
-            self._target_temperature = temp
             await self._mqtt_handler.async_publish({"userSettings":{"manualControlTemp": int(temp*10)}})
             self.async_write_ha_state()
 
@@ -8,7 +8,7 @@ from homeassistant.data_entry_flow import FlowResult
 
 from .const import DOMAIN
 
-_SERIAL_RE = re.compile(r"^(?:[0-9A-F]{2}[:-]){5}[0-9A-F]{2}$", re.IGNORECASE)
+_SERIAL_RE = re.compile(r"(?:[0-9A-F]{2}[:-]){5}[0-9A-F]{2}", re.IGNORECASE)
 
 DATA_SCHEMA = vol.Schema({vol.Required("serial"): str})
 
@@ -20,11 +20,12 @@ class EbecoMQTTConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            serial_raw: str = user_input["serial"].strip().upper()
+            serial_raw: str = user_input["serial"].strip()
 
-            if not _SERIAL_RE.match(serial_raw):
+            if not _SERIAL_RE.fullmatch(serial_raw):
                 errors["serial"] = "invalid_serial"
             else:
+                serial_raw = serial_raw.upper()
                 await self.async_set_unique_id(serial_raw)
                 self._abort_if_unique_id_configured()
 
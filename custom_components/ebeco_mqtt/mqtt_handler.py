@@ -1,9 +1,14 @@
 """Handle MQTT communication for Ebeco."""
 
 import logging
-import json
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Any
+
+import orjson
 
 from homeassistant.components import mqtt
+from homeassistant.core import callback
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -13,36 +18,47 @@ class EbecoMqttHandler:
     def __init__(self, hass, serial: str):
         self.hass = hass
         self.serial = serial
-        self._callbacks: list[callable[[float], None]] = []
+        self._pub_topic = f"devices/{serial}/messages/devicebound/data"
+        self._sub_topic = f"devices/{serial}/messages/events/#"
+        self._callbacks: tuple[Callable[[Mapping[str, Any]], None], ...] = ()
         self._unsub = None  # holds the unsubscribe function
 
     # --------- publisher helpers -------- #
     async def async_publish(self, data) -> None:
         await mqtt.async_publish(
-            self.hass, f"devices/{self.serial}/messages/devicebound/data", json.dumps(data)
+            self.hass, self._pub_topic, orjson.dumps(data)
         )
 
     # --------- subscription helpers ----- #
     async def async_subscribe(self, cb):
         """Subscribe once and fan-out every update to all registered callbacks."""
        
-        _LOGGER.info("Time to subscribe")
+        _LOGGER.debug("Time to subscribe")
        
         # First caller creates the subscription
         if self._unsub is None:
-            async def _message(msg):
+            @callback
+            def _message(msg):
 
-                _LOGGER.info("Got data %s", msg.payload)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Got data %s", msg.payload)
 
-                for callback in self._callbacks:
-                    self.hass.async_create_task(callback(json.loads(msg.payload)))
+                # Every subscriber gets the same payload; only its top level is
+                # read-only, the nested section dicts are shared and mutable
+                payload = MappingProxyType(orjson.loads(msg.payload))
+                for message_cb in self._callbacks:
+                    try:
+                        message_cb(payload)
+                    except Exception:  # noqa: BLE001
+                        # Keep one failing subscriber from starving the rest
+                        _LOGGER.exception("Error handling MQTT update for %s", self.serial)
 
 
-            _LOGGER.info("Subscribed to %s", f"devices/{self.serial}/messages/events/#")
+            _LOGGER.debug("Subscribed to %s", self._sub_topic)
 
             self._unsub = await mqtt.async_subscribe(
-                self.hass, f"devices/{self.serial}/messages/events/#", _message
+                self.hass, self._sub_topic, _message
             )
 
         # Register the callback for this entity
-        self._callbacks.append(cb)
\ No newline at end of file
+        self._callbacks = self._callbacks + (cb,)
\ No newline at end of file
@@ -29,55 +29,61 @@ Options
 from __future__ import annotations
 
 import argparse
+import mmap
+import re
 from pathlib import Path
-from typing import List, Tuple, Sequence
+from typing import Iterator, List, Tuple, Sequence
 
 CERT_BEGIN = b"-----BEGIN CERTIFICATE-----"
 CERT_END = b"-----END CERTIFICATE-----"
 WHITESPACE = b" \t\r\n"  # ASCII whitespace bytes we ignore between bundles
+_WS_RE = re.compile(b"[" + re.escape(WHITESPACE) + b"]*")  # a (possibly empty) WHITESPACE run
+# Only the leading dashes are consumed, so a marker starting inside the
+# trailing dashes of the previous one is still reported
+_MARKER_RE = re.compile(rb"-----(?=(BEGIN|END) CERTIFICATE-----)")
 
 # ---------------------------------------------------------------------------
 # Scanning helpers
 # ---------------------------------------------------------------------------
 
-def _scan_single(data: bytes, pos: int) -> Tuple[int, int] | None:
-    """Return *(start, end)* byte offsets of the bundle beginning at/after *pos*.
+def _iter_markers(data: bytes) -> Iterator[Tuple[bool, int]]:
+    """Yield *(is_begin, offset)* for every BEGIN/END marker in *data*, in order."""
+    for m in _MARKER_RE.finditer(data):
+        yield m.group(1) == b"BEGIN", m.start()
+
+
+def find_all_bundles(data: bytes) -> List[Tuple[int, int]]:
+    """Return list of *(start, end)* for every PEM bundle in *data*.
 
     Adjacent bundles separated only by ASCII whitespace are merged.
-    Returns ``None`` if no BEGIN marker is found beyond *pos*.
+    *data* may be ``bytes`` or a read-only :class:`mmap.mmap`.
     """
-    start = data.find(CERT_BEGIN, pos)
-    if start == -1:
-        return None
-
-    end = start
-    while True:
-        next_end = data.find(CERT_END, end)
-        if next_end == -1:
-            raise ValueError("Malformed bundle: BEGIN without matching END")
-        end = next_end + len(CERT_END)
+    bundles: List[Tuple[int, int]] = []
+    start: int | None = None  # offset of the open bundle's BEGIN, if any
+    pos = 0  # markers before this offset have already been consumed
+    for is_begin, offset in _iter_markers(data):
+        if offset < pos:
+            continue
+        if start is None:
+            # Stray END markers outside a bundle are ignored
+            if is_begin:
+                start = offset
+            continue
+        if is_begin:
+            # BEGIN inside an open bundle; wait for its END
+            continue
 
         # Eat trailing whitespace (spaces, tabs, CR, LF)
-        while end < len(data) and data[end : end + 1] in WHITESPACE:
-            end += 1
+        pos = _WS_RE.match(data, offset + len(CERT_END)).end()
 
         # If another BEGIN follows immediately, keep consuming
-        if data.startswith(CERT_BEGIN, end):
+        if data[pos : pos + len(CERT_BEGIN)] == CERT_BEGIN:
             continue
-        return start, end
-
+        bundles.append((start, pos))
+        start = None
 
-def find_all_bundles(data: bytes) -> List[Tuple[int, int]]:
-    """Return list of *(start, end)* for every PEM bundle in *data*."""
-    bundles: List[Tuple[int, int]] = []
-    pos = 0
-    while True:
-        res = _scan_single(data, pos)
-        if res is None:
-            break
-        start, end = res
-        bundles.append((start, end))
-        pos = end
+    if start is not None:
+        raise ValueError("Malformed bundle: BEGIN without matching END")
     return bundles
 
 # ---------------------------------------------------------------------------
@@ -112,10 +118,15 @@ def patch_bundle(
     strict: bool = False,
 ) -> None:
     """Patch selected bundles in *input_path* with *cert_path* and write *output_path*."""
-    blob = input_path.read_bytes()
-    bundles = find_all_bundles(blob)
-    if not bundles:
-        raise ValueError("No certificate bundles found in input binary")
+    # Scan the input through a read-only mapping; only the output is copied
+    with input_path.open("rb") as fh:
+        if input_path.stat().st_size == 0:
+            raise ValueError("No certificate bundles found in input binary")
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as blob:
+            bundles = find_all_bundles(blob)
+            if not bundles:
+                raise ValueError("No certificate bundles found in input binary")
+            buf = bytearray(blob)
 
     # Determine which bundles to patch
     if indices is None:
@@ -125,6 +136,7 @@ def patch_bundle(
 
     replacement = cert_path.read_bytes()
 
+    # Replacements are padded to the original length, so patch in place
     for idx, (start, end) in enumerate(targets):
         orig_len = end - start
         new = replacement
@@ -140,13 +152,13 @@ def patch_bundle(
                     f"and --strict specified"
                 )
             new += b"\x00" * (orig_len - len(new))
-        blob = blob[:start] + new + blob[end:]
+        buf[start:end] = new
         print(
             f"Patched bundle #{idx} @0x{start:X}-0x{end:X} "
             f"with {len(replacement)} bytes (kept {orig_len})"
         )
 
-    output_path.write_bytes(blob)
+    output_path.write_bytes(buf)
     print(
         f"→ {output_path} written: {len(targets)} of {len(bundles)} bundle(s) patched"
     )